@@ -10,19 +10,34 @@ import (
 	"os"
 )
 
+var directives = [][]byte{[]byte("TEXT"), []byte("DATA"), []byte("GLOBL")}
+
+func hasDirectivePrefix(line []byte) bool {
+	for _, directive := range directives {
+		if bytes.HasPrefix(line, directive) {
+			return true
+		}
+	}
+	return false
+}
+
+// Scan the file once, checking the start of each line for a Go assembler directive.
 func maybeGolangAssembly(filename string) (bool, error) {
 	data, err := os.ReadFile(filename)
 	if err != nil {
 		return false, err
 	}
 
-	if bytes.HasPrefix(data, []byte("TEXT")) || bytes.Contains(data, []byte("\nTEXT")) ||
-		bytes.HasPrefix(data, []byte("DATA")) || bytes.Contains(data, []byte("\nDATA")) ||
-		bytes.HasPrefix(data, []byte("GLOBL")) || bytes.Contains(data, []byte("\nGLOBL")) {
-		return true, nil
+	for {
+		if hasDirectivePrefix(data) {
+			return true, nil
+		}
+		i := bytes.IndexByte(data, '\n')
+		if i < 0 {
+			return false, nil
+		}
+		data = data[i+1:]
 	}
-
-	return false, nil
 }
 
 func main() {
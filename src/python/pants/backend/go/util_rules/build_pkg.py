@@ -182,22 +182,20 @@ class BuildGoPackageRequest(EngineAwareParameter):
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return NotImplemented
+        if self is other:
+            return True
         return (
             self._hashcode == other._hashcode
             and self.import_path == other.import_path
             and self.pkg_name == other.pkg_name
             and self.digest == other.digest
             and self.dir_path == other.dir_path
-            and self.build_opts == other.build_opts
-            and self.import_map == other.import_map
             and self.go_files == other.go_files
             and self.s_files == other.s_files
             and self.minimum_go_version == other.minimum_go_version
             and self.for_tests == other.for_tests
-            and self.embed_config == other.embed_config
             and self.with_coverage == other.with_coverage
             and self.cgo_files == other.cgo_files
-            and self.cgo_flags == other.cgo_flags
             and self.c_files == other.c_files
             and self.header_files == other.header_files
             and self.cxx_files == other.cxx_files
@@ -207,6 +205,14 @@ class BuildGoPackageRequest(EngineAwareParameter):
             and self.pkg_specific_compiler_flags == other.pkg_specific_compiler_flags
             and self.pkg_specific_assembler_flags == other.pkg_specific_assembler_flags
             and self.is_stdlib == other.is_stdlib
+            # Fields with non-trivial `__eq__` implementations are compared after the scalar fields.
+            and self.build_opts == other.build_opts
+            and self.import_map == other.import_map
+            and self.embed_config == other.embed_config
+            and self.cgo_flags == other.cgo_flags
+            # NB: Tuple comparison checks identity before calling `__eq__` on each element, and the
+            # DAG is structure-shared, so this only recurses into dependencies which are distinct
+            # objects with equal hashcodes.
             # TODO: Use a recursive memoized __eq__ if this ever shows up in profiles.
             and self.direct_dependencies == other.direct_dependencies
         )
@@ -235,13 +241,9 @@ class FallibleBuildGoPackageRequest(EngineAwareParameter, EngineAwareReturnType)
         )
 
     def message(self) -> str:
-        message = self.import_path
-        message += (
-            " succeeded." if self.exit_code == 0 else f" failed (exit code {self.exit_code})."
-        )
-        if self.stderr:
-            message += f"\n{self.stderr}"
-        return message
+        status = "succeeded." if self.exit_code == 0 else f"failed (exit code {self.exit_code})."
+        stderr = f"\n{self.stderr}" if self.stderr else ""
+        return f"{self.import_path} {status}{stderr}"
 
     def cacheable(self) -> bool:
         # Failed compile outputs should be re-rendered in every run.
@@ -265,15 +267,10 @@ class FallibleBuiltGoPackage(EngineAwareReturnType):
         )
 
     def message(self) -> str:
-        message = self.import_path
-        message += (
-            " succeeded." if self.exit_code == 0 else f" failed (exit code {self.exit_code})."
-        )
-        if self.stdout:
-            message += f"\n{self.stdout}"
-        if self.stderr:
-            message += f"\n{self.stderr}"
-        return message
+        status = "succeeded." if self.exit_code == 0 else f"failed (exit code {self.exit_code})."
+        stdout = f"\n{self.stdout}" if self.stdout else ""
+        stderr = f"\n{self.stderr}" if self.stderr else ""
+        return f"{self.import_path} {status}{stdout}{stderr}"
 
     def cacheable(self) -> bool:
         # Failed compile outputs should be re-rendered in every run.
@@ -305,7 +302,15 @@ class RenderedEmbedConfig:
 
 @dataclass(frozen=True)
 class GoCompileActionIdRequest:
-    build_request: BuildGoPackageRequest
+    """The subset of a `BuildGoPackageRequest` which contributes to its compile action ID.
+
+    Using only these fields (rather than the entire request) allows the engine to reuse the action
+    ID across build requests which differ only in fields which do not affect it.
+    """
+
+    import_path: str
+    minimum_go_version: str | None
+    has_s_files: bool
 
 
 @dataclass(frozen=True)
@@ -426,6 +431,9 @@ async def _maybe_copy_headers_to_platform_independent_names(
     header_files: tuple[str, ...],
     goroot: GoRoot,
 ) -> Digest | None:
+    if not header_files:
+        return None
+
     goos_goarch = f"_{goroot.goos}_{goroot.goarch}"
     goos = f"_{goroot.goos}"
     goarch = f"_{goroot.goarch}"
@@ -437,13 +445,11 @@ async def _maybe_copy_headers_to_platform_independent_names(
 
     new_digest_entries: list[FileEntry] = []
     for header_file in header_files:
-        header_file_path = PurePath(dir_path, header_file)
-
-        entry = digest_entries_by_path.get(str(header_file_path))
+        entry = digest_entries_by_path.get(os.path.join(dir_path, header_file))
         if not entry:
             continue
 
-        stem = header_file_path.stem
+        stem, suffix = os.path.splitext(header_file)
         new_stem: str | None = None
         if stem.endswith(goos_goarch):
             new_stem = stem[0 : -len(goos_goarch)] + "_GOOS_GOARCH"
@@ -453,8 +459,8 @@ async def _maybe_copy_headers_to_platform_independent_names(
             new_stem = stem[0 : -len(goarch)] + "_GOARCH"
 
         if new_stem:
-            new_header_file_path = PurePath(dir_path, f"{new_stem}{header_file_path.suffix}")
-            new_digest_entries.append(dataclasses.replace(entry, path=str(new_header_file_path)))
+            new_header_file_path = os.path.join(dir_path, f"{new_stem}{suffix}")
+            new_digest_entries.append(dataclasses.replace(entry, path=new_header_file_path))
 
     if new_digest_entries:
         digest = await Get(Digest, CreateDigest(new_digest_entries))
@@ -496,6 +502,41 @@ async def _gather_transitive_prebuilt_object_files(
     return object_digest, frozenset(object_files)
 
 
+# Standard library packages which are compiled as part of the runtime.
+_RUNTIME_PACKAGES = frozenset(
+    (
+        "internal/abi",
+        "internal/bytealg",
+        "internal/coverage/rtcov",
+        "internal/cpu",
+        "internal/goarch",
+        "internal/goos",
+        "runtime",
+        "runtime/internal/atomic",
+        "runtime/internal/math",
+        "runtime/internal/sys",
+        "runtime/internal/syscall",
+    )
+)
+
+# A few standard packages have forward declarations for pieces supplied behind-the-scenes by
+# package runtime, and so must not be compiled with `-complete`.
+_PACKAGES_WITH_RUNTIME_FORWARD_DECLARATIONS = frozenset(
+    (
+        "bytes",
+        "internal/poll",
+        "net",
+        "os",
+        "runtime/metrics",
+        "runtime/pprof",
+        "runtime/trace",
+        "sync",
+        "syscall",
+        "time",
+    )
+)
+
+
 # NB: We must have a description for the streaming of this rule to work properly
 # (triggered by `FallibleBuiltGoPackage` subclassing `EngineAwareReturnType`).
 @rule(desc="Compile with Go", level=LogLevel.DEBUG)
@@ -508,7 +549,9 @@ async def build_go_package(
     )
 
     import_paths_to_pkg_a_files: dict[str, str] = {}
-    dep_digests = []
+    # NB: A dict is used as an ordered set, since a dependency's digest would otherwise be added once
+    # per import path which it contributes.
+    dep_digests: dict[Digest, None] = {}
     for maybe_dep in maybe_built_deps:
         if maybe_dep.output is None:
             return dataclasses.replace(
@@ -518,10 +561,9 @@ async def build_go_package(
         for dep_import_path, pkg_archive_path in dep.import_paths_to_pkg_a_files.items():
             if dep_import_path not in import_paths_to_pkg_a_files:
                 import_paths_to_pkg_a_files[dep_import_path] = pkg_archive_path
-                dep_digests.append(dep.digest)
+                dep_digests[dep.digest] = None
 
-    merged_deps_digest, import_config, embedcfg, action_id_result = await MultiGet(
-        Get(Digest, MergeDigests(dep_digests)),
+    import_config, embedcfg, action_id_result = await MultiGet(
         Get(
             ImportConfig,
             ImportConfigRequest(
@@ -531,11 +573,18 @@ async def build_go_package(
             ),
         ),
         Get(RenderedEmbedConfig, RenderEmbedConfigRequest(request.embed_config)),
-        Get(GoCompileActionIdResult, GoCompileActionIdRequest(request)),
+        Get(
+            GoCompileActionIdResult,
+            GoCompileActionIdRequest(
+                import_path=request.import_path,
+                minimum_go_version=request.minimum_go_version,
+                has_s_files=bool(request.s_files),
+            ),
+        ),
     )
 
     unmerged_input_digests = [
-        merged_deps_digest,
+        *dep_digests,
         import_config.digest,
         embedcfg.digest,
         request.digest,
@@ -597,18 +646,20 @@ async def build_go_package(
                     new_s_files.append(s_file)
             s_files = new_s_files
         else:
-            asm_check_result = await Get(
-                CheckForGolangAssemblyResult,
-                CheckForGolangAssemblyRequest(
-                    digest=request.digest,
-                    dir_path=request.dir_path,
-                    s_files=tuple(s_files),
-                ),
-            )
-            if asm_check_result.maybe_golang_assembly:
-                raise ValueError(
-                    f"Package {request.import_path} is a cgo package but contains Go assembly files."
+            # Only run the check binary if there are any assembly files to check.
+            if s_files:
+                asm_check_result = await Get(
+                    CheckForGolangAssemblyResult,
+                    CheckForGolangAssemblyRequest(
+                        digest=request.digest,
+                        dir_path=request.dir_path,
+                        s_files=tuple(s_files),
+                    ),
                 )
+                if asm_check_result.maybe_golang_assembly:
+                    raise ValueError(
+                        f"Package {request.import_path} is a cgo package but contains Go assembly files."
+                    )
             gcc_s_files = s_files
             s_files = []  # Clear s_files since assembly has already been handled in cgo rules.
 
@@ -670,8 +721,10 @@ async def build_go_package(
     # Note: The assembly files cannot be assembled at this point because a similar process happens from Go to
     # assembly: The Go compiler generates a `go_asm.h` header file with metadata about the Go code in the package.
     symabis_path: str | None = None
-    extra_assembler_flags = tuple(
-        *request.build_opts.assembler_flags, *request.pkg_specific_assembler_flags
+    compile_input_digests = [input_digest]
+    extra_assembler_flags = (
+        *request.build_opts.assembler_flags,
+        *request.pkg_specific_assembler_flags,
     )
     if s_files:
         symabis_fallible_result = await Get(
@@ -693,9 +746,7 @@ async def build_go_package(
                 stdout=symabis_fallible_result.stdout,
                 stderr=symabis_fallible_result.stderr,
             )
-        input_digest = await Get(
-            Digest, MergeDigests([input_digest, symabis_result.symabis_digest])
-        )
+        compile_input_digests.append(symabis_result.symabis_digest)
         symabis_path = symabis_result.symabis_path
 
     # Build the arguments for compiling the Go code in this package.
@@ -722,19 +773,7 @@ async def build_go_package(
     if request.is_stdlib:
         compile_args.append("-std")
 
-    compiling_runtime = request.is_stdlib and request.import_path in (
-        "internal/abi",
-        "internal/bytealg",
-        "internal/coverage/rtcov",
-        "internal/cpu",
-        "internal/goarch",
-        "internal/goos",
-        "runtime",
-        "runtime/internal/atomic",
-        "runtime/internal/math",
-        "runtime/internal/sys",
-        "runtime/internal/syscall",
-    )
+    compiling_runtime = request.is_stdlib and request.import_path in _RUNTIME_PACKAGES
 
     # From Go sources:
     # runtime compiles with a special gc flag to check for
@@ -773,20 +812,7 @@ async def build_go_package(
     # If there are no loose object files to add to the package archive later or assembly files to assemble,
     # then pass -complete flag which tells the compiler that the provided Go files constitute the entire package.
     if not objects and not s_files:
-        # Exceptions: a few standard packages have forward declarations for
-        # pieces supplied behind-the-scenes by package runtime.
-        if request.import_path not in (
-            "bytes",
-            "internal/poll",
-            "net",
-            "os",
-            "runtime/metrics",
-            "runtime/pprof",
-            "runtime/trace",
-            "sync",
-            "syscall",
-            "time",
-        ):
+        if request.import_path not in _PACKAGES_WITH_RUNTIME_FORWARD_DECLARATIONS:
             compile_args.append("-complete")
 
     # Add any extra compiler flags after the ones added automatically by this rule.
@@ -815,7 +841,9 @@ async def build_go_package(
     go_sources_file_paths_digest = await Get(
         Digest, CreateDigest([FileContent("__sources__.txt", go_source_file_paths_config.encode())])
     )
-    input_digest = await Get(Digest, MergeDigests([input_digest, go_sources_file_paths_digest]))
+    input_digest = await Get(
+        Digest, MergeDigests([*compile_input_digests, go_sources_file_paths_digest])
+    )
     compile_args.append("@__sources__.txt")
 
     compile_result = await Get(
@@ -881,24 +909,24 @@ async def build_go_package(
 
     # If there are any loose object files, link them into the package archive.
     if objects:
+        # Many object files share the same digest (e.g., all of the Cgo outputs), so only pass each
+        # distinct digest once.
+        obj_file_paths = sorted(obj_file for obj_file, _ in objects)
+        obj_digests = dict.fromkeys(digest for _, digest in objects)
         assembly_link_input_digest = await Get(
-            Digest,
-            MergeDigests(
-                [
-                    compilation_digest,
-                    *(digest for obj_file, digest in objects),
-                ]
-            ),
+            Digest, MergeDigests([compilation_digest, *obj_digests])
         )
         assembly_link_result = await _add_objects_to_archive(
             input_digest=assembly_link_input_digest,
             pkg_archive_path="__pkg__.a",
-            obj_file_paths=sorted(obj_file for obj_file, digest in objects),
+            obj_file_paths=obj_file_paths,
         )
         compilation_digest = assembly_link_result.output_digest
 
-    path_prefix = os.path.join("__pkgs__", path_safe(request.import_path))
-    import_paths_to_pkg_a_files[request.import_path] = os.path.join(path_prefix, "__pkg__.a")
+    # NB: Both components are known to be non-empty relative paths, so plain string formatting is
+    # equivalent to `os.path.join` here.
+    path_prefix = f"__pkgs__/{path_safe(request.import_path)}"
+    import_paths_to_pkg_a_files[request.import_path] = f"{path_prefix}/__pkg__.a"
     output_digest = await Get(Digest, AddPrefix(compilation_digest, path_prefix))
     merged_result_digest = await Get(Digest, MergeDigests([*dep_digests, output_digest]))
 
@@ -959,42 +987,49 @@ async def render_embed_config(request: RenderEmbedConfigRequest) -> RenderedEmbe
 async def compute_compile_action_id(
     request: GoCompileActionIdRequest, goroot: GoRoot
 ) -> GoCompileActionIdResult:
-    bq = request.build_request
-
-    h = hashlib.sha256()
+    # NB: The parts of the key are accumulated and then hashed in one shot, rather than updating the
+    # hash incrementally for each (small) part.
+    key_parts: list[str] = []
 
     # All Go action IDs have the full version (as returned by `runtime.Version()`) in the key.
     # See https://github.com/golang/go/blob/master/src/cmd/go/internal/cache/hash.go#L32-L46
-    h.update(goroot.full_version.encode())
+    key_parts.append(goroot.full_version)
 
-    h.update(b"compile\n")
-    if bq.minimum_go_version:
-        h.update(f"go {bq.minimum_go_version}\n".encode())
-    h.update(f"goos {goroot.goos} goarch {goroot.goarch}\n".encode())
-    h.update(f"import {bq.import_path}\n".encode())
+    key_parts.append("compile\n")
+    if request.minimum_go_version:
+        key_parts.append(f"go {request.minimum_go_version}\n")
+    key_parts.append(f"goos {goroot.goos} goarch {goroot.goarch}\n")
+    key_parts.append(f"import {request.import_path}\n")
     # TODO: Consider what to do with this information from Go tool:
     # fmt.Fprintf(h, "omitdebug %v standard %v local %v prefix %q\n", p.Internal.OmitDebug, p.Standard, p.Internal.Local, p.Internal.LocalPrefix)
     # TODO: Inject cgo-related values here.
     # TODO: Inject cover mode values here.
     # TODO: Inject fuzz instrumentation values here.
 
-    compile_tool_id = await Get(GoSdkToolIDResult, GoSdkToolIDRequest("compile"))
-    h.update(f"compile {compile_tool_id.tool_id}\n".encode())
+    asm_tool_id: GoSdkToolIDResult | None = None
+    if request.has_s_files:
+        compile_tool_id, asm_tool_id = await MultiGet(
+            Get(GoSdkToolIDResult, GoSdkToolIDRequest("compile")),
+            Get(GoSdkToolIDResult, GoSdkToolIDRequest("asm")),
+        )
+    else:
+        compile_tool_id = await Get(GoSdkToolIDResult, GoSdkToolIDRequest("compile"))
+
+    key_parts.append(f"compile {compile_tool_id.tool_id}\n")
     # TODO: Add compiler flags as per `go`'s algorithm. Need to figure out
-    if bq.s_files:
-        asm_tool_id = await Get(GoSdkToolIDResult, GoSdkToolIDRequest("asm"))
-        h.update(f"asm {asm_tool_id.tool_id}\n".encode())
+    if asm_tool_id:
+        key_parts.append(f"asm {asm_tool_id.tool_id}\n")
         # TODO: Add asm flags as per `go`'s algorithm.
     # TODO: Add micro-architecture into cache key (e.g., GOAMD64 setting).
     if "GOEXPERIMENT" in goroot._raw_metadata:
-        h.update(f"GOEXPERIMENT={goroot._raw_metadata['GOEXPERIMENT']}".encode())
+        key_parts.append(f"GOEXPERIMENT={goroot._raw_metadata['GOEXPERIMENT']}")
     # TODO: Maybe handle go "magic" env vars: "GOCLOBBERDEADHASH", "GOSSAFUNC", "GOSSADIR", "GOSSAHASH" ?
     # TODO: Handle GSHS_LOGFILE compiler debug option by breaking cache?
 
     # Note: Input files are already part of cache key. Thus, this algorithm omits incorporating their
     # content hashes into the action ID.
 
-    return GoCompileActionIdResult(h.hexdigest())
+    return GoCompileActionIdResult(hashlib.sha256("".join(key_parts).encode()).hexdigest())
 
 
 def rules():
@@ -49,7 +49,7 @@ class Glob:
         return cls(pattern, re.compile(glob_to_regexp(pattern)))
 
     def match(self, value: str) -> bool:
-        return bool(re.match(self.regexp, value))
+        return bool(self.regexp.match(value))
 
     def __str__(self) -> str:
         return self.raw
@@ -141,9 +141,11 @@ class PathGlob:
             False
             if match_path is None
             else bool(
-                (re.search if self.anchor_mode is PathGlobAnchorMode.FLOATING else re.match)(
-                    self.glob, match_path
-                )
+                (
+                    self.glob.search
+                    if self.anchor_mode is PathGlobAnchorMode.FLOATING
+                    else self.glob.match
+                )(match_path)
             )
         )
 
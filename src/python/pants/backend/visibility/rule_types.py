@@ -2,7 +2,6 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
-import itertools
 import logging
 import os.path
 from dataclasses import dataclass, field
@@ -104,18 +103,28 @@ class VisibilityRule:
 def flatten(xs, *types: type) -> Iterator:
     """Return an iterator with values, regardless of the nesting of the input."""
     assert types
-    if str in types and isinstance(xs, str):
-        yield from (x.strip() for x in xs.splitlines())
-    elif isinstance(xs, types):
-        yield xs
-    elif isinstance(xs, Iterable):
-        yield from itertools.chain.from_iterable(flatten(x, *types) for x in xs)
-    elif isinstance(xs, PurePath):
-        yield str(xs)
-    elif type(xs).__name__ == "Registrar":
-        yield f"<{xs}>"
-    else:
-        raise ValueError(f"expected {' or '.join(typ.__name__ for typ in types)} but got: {xs!r}")
+    # NB: Nested iterables are traversed using an explicit stack of iterators, rather than through
+    # recursive generators, so that each value is only yielded through a single generator frame.
+    stack: list[Iterator] = [iter((xs,))]
+    while stack:
+        for x in stack[-1]:
+            if str in types and isinstance(x, str):
+                yield from (line.strip() for line in x.splitlines())
+            elif isinstance(x, types):
+                yield x
+            elif isinstance(x, Iterable):
+                stack.append(iter(x))
+                break
+            elif isinstance(x, PurePath):
+                yield str(x)
+            elif type(x).__name__ == "Registrar":
+                yield f"<{x}>"
+            else:
+                raise ValueError(
+                    f"expected {' or '.join(typ.__name__ for typ in types)} but got: {x!r}"
+                )
+        else:
+            stack.pop()
 
 
 @dataclass(frozen=True)
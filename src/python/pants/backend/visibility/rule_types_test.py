@@ -108,6 +108,18 @@ def test_dead_ruleset() -> None:
                 ),
             ),
         ),
+        (
+            ["foo", "bar", "baz"],
+            (
+                (),
+                "foo",
+                (
+                    (),
+                    ("bar",),
+                ),
+                "baz",
+            ),
+        ),
         (
             ["src/test"],
             PurePath("src/test"),